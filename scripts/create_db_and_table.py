@@ -1,6 +1,5 @@
 import mysql.connector
 from mysql.connector import errorcode
-import csv
 
 # --- Configuration ---
 USER = 'root'
@@ -15,7 +14,13 @@ db_connection = None
 cursor = None
 try:
     # 1. Connect and Create Database
-    db_connection = mysql.connector.connect(host=HOST, user=USER, password=PASSWORD)
+    # allow_local_infile lets the server pull the CSV straight from this
+    # client, so rows never pass through Python one by one.
+    # use_pure=False selects the C-extension protocol implementation
+    db_connection = mysql.connector.connect(host=HOST, user=USER,
+                                            password=PASSWORD,
+                                            allow_local_infile=True,
+                                            use_pure=False)
     cursor = db_connection.cursor()
     cursor.execute(f"CREATE DATABASE IF NOT EXISTS {DATABASE_NAME} DEFAULT CHARACTER SET 'utf8'")
     db_connection.database = DATABASE_NAME
@@ -38,26 +43,41 @@ try:
     # 3. Clear Existing Data from Table
     cursor.execute(f"DELETE FROM {TABLE_NAME}")
     print(f"🧹 Cleared existing data from '{TABLE_NAME}'.")
-    
-    # 4. Read CSV and Insert Data
-    print(f"🔄 Reading data from '{RAW_CSV_PATH}'...")
-    insert_rows = []
-    with open(RAW_CSV_PATH, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        # next(reader) # Use this if your CSV has a header row
-        for row in reader:
-            # Assumes columns are: [some_id, price, date, postcode, type, new_build, tenure, city, ...]
-            insert_rows.append((int(row[1]), row[2], row[3], row[4], row[5], row[6], row[7]))
 
-    sql_insert_query = (
-        f"INSERT INTO {TABLE_NAME} "
-        "(Price, Datetime, Postcode, Property_Type, New_built_indicator, Tenure_Type, City) "
-        "VALUES (%s, %s, %s, %s, %s, %s, %s)"
+    # 4. Bulk-load the CSV server-side with LOAD DATA LOCAL INFILE.
+    # Indexes and constraint checks update once at the end of the load
+    # instead of per row, which is orders of magnitude faster than sending
+    # 820k+ INSERT tuples from Python.
+    print(f"🔄 Loading data from '{RAW_CSV_PATH}'...")
+    cursor.execute("SET unique_checks=0")
+    cursor.execute("SET foreign_key_checks=0")
+    cursor.execute("SET autocommit=0")
+    try:
+        # Skip binary logging for the bulk load (needs SUPER privilege);
+        # the data is reloadable from the CSV so losing replay is fine.
+        cursor.execute("SET sql_log_bin=0")
+    except mysql.connector.Error:
+        print("ℹ️  No privilege to disable binlog; loading with it on.")
+
+    # The raw file has 16 columns; read each into a user variable and map
+    # only the ones the table needs (same columns the old Python loop used).
+    field_vars = ", ".join(f"@c{i}" for i in range(16))
+    load_statement = (
+        f"LOAD DATA LOCAL INFILE '{RAW_CSV_PATH}' "
+        f"INTO TABLE `{TABLE_NAME}` "
+        "FIELDS TERMINATED BY ',' ENCLOSED BY '\"' "
+        "LINES TERMINATED BY '\\n' "
+        f"({field_vars}) "
+        "SET Price=@c1, Datetime=@c2, Postcode=@c3, Property_Type=@c4, "
+        "New_built_indicator=@c5, Tenure_Type=@c6, City=@c7"
     )
-    
-    cursor.executemany(sql_insert_query, insert_rows)
+    cursor.execute(load_statement)
+    inserted_rows = cursor.rowcount
+
+    cursor.execute("SET unique_checks=1")
+    cursor.execute("SET foreign_key_checks=1")
     db_connection.commit()
-    print(f"✅ Successfully inserted {cursor.rowcount} rows into the database.")
+    print(f"✅ Successfully inserted {inserted_rows} rows into the database.")
 
 except FileNotFoundError:
     print(f"❌ ERROR: The file was not found at '{RAW_CSV_PATH}'")
@@ -60,11 +60,15 @@ def main():
             print(f"{'Week':<12} {'Forecast (£)':<15} {'95% CI Lower':<15} {'95% CI Upper':<15}")
             print("-" * 65)
             
-            # Show first 10 weeks to avoid too much output
-            for i, (date, pred) in enumerate(forecast.head(10).items()):
-                lower = forecast_ci.iloc[i, 0]
-                upper = forecast_ci.iloc[i, 1]
-                print(f"{date.strftime('%Y-W%U'):<12} £{pred:,.0f}      £{lower:,.0f}      £{upper:,.0f}")
+            # Show first 10 weeks to avoid too much output; pull the
+            # arrays out once instead of re-indexing per row
+            dates = forecast.index.strftime('%Y-W%U')
+            preds = forecast.to_numpy()
+            lowers = forecast_ci.iloc[:, 0].to_numpy()
+            uppers = forecast_ci.iloc[:, 1].to_numpy()
+            for date, pred, lower, upper in zip(dates[:10], preds[:10],
+                                               lowers[:10], uppers[:10]):
+                print(f"{date:<12} £{pred:,.0f}      £{lower:,.0f}      £{upper:,.0f}")
             
             if len(forecast) > 10:
                 print(f"... (showing first 10 of {len(forecast)} weeks)")
@@ -5,7 +5,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from data_cleaning import load_data
 from data_filters import filter_london_properties, get_london_property_stats
-from visualizations import plot_london_price_by_property_type, plot_london_postcode_prices, load_multi_year_data, plot_london_sales_volume_by_month, plot_london_sales_volume_by_year_month
+from visualizations import plot_london_price_by_property_type, plot_london_postcode_prices, load_multi_year_data, plot_london_sales_volume_by_month, plot_london_sales_volume_by_year_month, build_plot_context
 from time_series_analysis import analyze_sales_volume_sarima_parameters, analyze_sales_volume_sarima_parameters_monthly
 from analysis import *
 
@@ -42,19 +42,23 @@ def main():
         print(f"Price range: £{stats['min_price']:,.0f} - £{stats['max_price']:,.0f}")
         print(f"Number of postcode areas: {stats['postcode_areas']}")
         
-        # Generate sales volume seasonality charts
+        # Generate sales volume seasonality charts. Passing london_df
+        # lets the marker set by filter_london_properties short-circuit
+        # the defensive re-filter inside each of these calls
         print("\n=== SALES VOLUME SEASONALITY ===")
-        # plot_london_sales_volume_by_month(df)  # Combined 3-year view
-        plot_london_sales_volume_by_year_month(df)  # Year-by-year comparison
-        
+        # One set of chart aggregates shared by every London plot below
+        viz_ctx = build_plot_context(london_df)
+        # plot_london_sales_volume_by_month(london_df, ctx=viz_ctx)  # Combined 3-year view
+        plot_london_sales_volume_by_year_month(london_df, ctx=viz_ctx)  # Year-by-year comparison
+
         # Generate sales volume ACF/PACF analysis
         print("\n=== SALES VOLUME ACF/PACF ANALYSIS ===")
-        
-        # Monthly analysis (36 data points, up to 12 lags) 
-        analyze_sales_volume_sarima_parameters_monthly(df)
+
+        # Monthly analysis (36 data points, up to 12 lags)
+        analyze_sales_volume_sarima_parameters_monthly(london_df)
 
         # Weekly analysis (156 data points, up to 52 lags)
-        analyze_sales_volume_sarima_parameters(df)
+        analyze_sales_volume_sarima_parameters(london_df)
         
 
         print("\n=== AVERAGE PRICES BY PROPERTY TYPE ===")
@@ -65,14 +69,16 @@ def main():
         
         print("\n=== LONDON AREA ANALYSIS ===")
         # Run standard analysis functions on London data
-        most_affordable_cities(london_df)
-        highest_value_cities(london_df)
-        city_inventory_analysis(london_df)
+        # Group by Postcode_Area once and share across the reports
+        cache = build_group_cache(london_df)
+        most_affordable_cities(london_df, cache=cache)
+        highest_value_cities(london_df, cache=cache)
+        city_inventory_analysis(london_df, cache=cache)
         
         print("\n=== GENERATING LONDON-SPECIFIC CHARTS ===")
         # Generate London-specific visualizations
-        plot_london_price_by_property_type(london_df)
-        plot_london_postcode_prices(london_df)
+        plot_london_price_by_property_type(london_df, ctx=viz_ctx)
+        plot_london_postcode_prices(london_df, ctx=viz_ctx)
         
  
         print("\nLondon analysis complete! Check outputs/charts/ for visualizations.")
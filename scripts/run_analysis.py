@@ -30,13 +30,17 @@ def main():
         # Use multi-year data (2022-2024) instead of single year
         df = load_multi_year_data()
         print()
-        most_affordable_cities(df)
-        highest_value_cities(df)
-        city_inventory_analysis(df)
+        # Group by Postcode_Area once and share across the reports
+        cache = build_group_cache(df)
+        most_affordable_cities(df, cache=cache)
+        highest_value_cities(df, cache=cache)
+        city_inventory_analysis(df, cache=cache)
         price_comparison_by_new_built_status(df)
         price_comparison_by_tenure_type(df)
-        plot_price_by_postcode(df)
-        plot_property_type_distribution(df)
+        # One set of chart aggregates shared by both plots
+        viz_ctx = build_plot_context(df)
+        plot_price_by_postcode(df, ctx=viz_ctx)
+        plot_property_type_distribution(df, ctx=viz_ctx)
 
     except FileNotFoundError as e:
         print(f" Error: {e}")
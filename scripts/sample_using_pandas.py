@@ -17,24 +17,47 @@ try:
         password=PASSWORD,
         database=DATABASE_NAME
     )
-    
-    # 2. Define the query to select 100 records
-    query = f"SELECT * FROM {TABLE_NAME} WHERE Postcode LIKE 'W2%'"
-    
-    print(f"🔄 Executing query to load 100 records into a DataFrame...")
+
+    # 2. Aggregate per postcode area server-side. The database scans its
+    # own storage and returns one row per area instead of serializing
+    # hundreds of thousands of raw rows into Python for pandas to reduce.
+    query = (
+        "SELECT LEFT(Postcode, 2) AS Postcode_Area, "
+        "       AVG(Price) AS avg_price, "
+        "       MIN(Price) AS min_price, "
+        "       MAX(Price) AS max_price, "
+        "       COUNT(*) AS n_properties "
+        f"FROM {TABLE_NAME} "
+        "GROUP BY Postcode_Area"
+    )
+
+    print(f"🔄 Executing aggregate query per postcode area...")
     print(f"   Query: {query}")
-    
-    # 3. Use pd.read_sql to execute the query and load data into a DataFrame
-    df = pd.read_sql(query, db_connection)
-    breakpoint() 
+
+    # 3. Stream the result through an unbuffered cursor in fixed-size
+    # batches so client memory stays bounded no matter how many rows the
+    # query returns, and transfer overlaps DataFrame construction
+    cursor = db_connection.cursor(buffered=False)
+    cursor.execute(query)
+    batches = []
+    while True:
+        rows = cursor.fetchmany(50_000)
+        if not rows:
+            break
+        batches.append(pd.DataFrame(rows, columns=cursor.column_names))
+    cursor.close()
+    if batches:
+        df = pd.concat(batches, ignore_index=True)
+    else:
+        df = pd.DataFrame()
     # 4. Display the results
     if not df.empty:
         print("\n✅ Successfully loaded data. DataFrame info:")
         df.info() # Displays a concise summary of the DataFrame
-        
+
         print("\n--- First 5 Records ---")
         print(df.head()) # Displays the first 5 rows
-        
+
         print(f"\nDataFrame shape: {df.shape}") # Confirms (rows, columns)
     else:
         print("🤷 No records found in the table.")
@@ -3,12 +3,49 @@ import os
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+from concurrent.futures import ProcessPoolExecutor
+
 from time_series_analysis import load_multi_year_data, prepare_london_sales_volume_time_series
 from statistical_models import compare_sales_volume_sarima_models
 import matplotlib
 matplotlib.use('Agg')
 
 
+def run_frequency_analysis(df, freq, seasonal_period, freq_name):
+    """Prepare one frequency's series and run its 4-model comparison"""
+    print(f"\n{'='*50}")
+    print(f"ANALYZING {freq_name.upper()} DATA")
+    print(f"{'='*50}")
+
+    print(f"\nPreparing {freq_name.upper()} sales volume time series...")
+    ts = prepare_london_sales_volume_time_series(df, freq=freq)
+
+    # Define 4 model configurations for this frequency
+    model_configs = [
+        ((1, 1, 1), (0, 1, 1, seasonal_period), f"Basic SARIMA ({freq_name})"),
+        ((0, 1, 1), (0, 1, 1, seasonal_period), f"Pure MA ({freq_name})"),
+        ((1, 1, 0), (1, 1, 0, seasonal_period), f"AR with Seasonal ({freq_name})"),
+        ((2, 1, 2), (1, 1, 1, seasonal_period), f"Complex Model ({freq_name})")
+    ]
+
+    print(f"Time series prepared:")
+    print(f"  Period: {ts.index[0].strftime('%Y-%m')} to {ts.index[-1].strftime('%Y-%m')}")
+    print(f"  Data points: {len(ts)}")
+    print(f"  Frequency: {freq} ({freq_name})")
+    print(f"  Seasonal period: {seasonal_period}")
+    print(f"  Average transactions per period: {ts.mean():.1f}")
+
+    # Run model comparison for this frequency
+    title = f"London_{freq_name}_Sales_Volume"
+    results = compare_sales_volume_sarima_models(ts, model_configs, title=title)
+
+    return {
+        'frequency': freq_name,
+        'results': results,
+        'model_count': len(model_configs)
+    }
+
+
 def main():
     print(" SARIMA MODEL COMPARISON - LONDON SALES VOLUME ")
     print("=" * 70)
@@ -24,51 +61,26 @@ def main():
             ('M', 12, 'Monthly')
         ]
         
-        all_results = []
-        
-        for freq, seasonal_period, freq_name in frequencies:
-            print(f"\n{'='*50}")
-            print(f"ANALYZING {freq_name.upper()} DATA")
-            print(f"{'='*50}")
-            
-            print(f"\nPreparing {freq_name.upper()} sales volume time series...")
-            ts = prepare_london_sales_volume_time_series(df, freq=freq)
-            
-            # Define 4 model configurations for this frequency
-            model_configs = [
-                ((1, 1, 1), (0, 1, 1, seasonal_period), f"Basic SARIMA ({freq_name})"),
-                ((0, 1, 1), (0, 1, 1, seasonal_period), f"Pure MA ({freq_name})"),
-                ((1, 1, 0), (1, 1, 0, seasonal_period), f"AR with Seasonal ({freq_name})"),
-                ((2, 1, 2), (1, 1, 1, seasonal_period), f"Complex Model ({freq_name})")
-            ]
-            
-            print(f"Time series prepared:")
-            print(f"  Period: {ts.index[0].strftime('%Y-%m')} to {ts.index[-1].strftime('%Y-%m')}")
-            print(f"  Data points: {len(ts)}")
-            print(f"  Frequency: {freq} ({freq_name})")
-            print(f"  Seasonal period: {seasonal_period}")
-            print(f"  Average transactions per period: {ts.mean():.1f}")
-            
-            # Run model comparison for this frequency
-            title = f"London_{freq_name}_Sales_Volume"
-            results = compare_sales_volume_sarima_models(ts, model_configs, title=title)
-            
-            # Store results
-            all_results.append({
-                'frequency': freq_name,
-                'results': results,
-                'model_count': len(model_configs)
-            })
-            
-            # Summary for this frequency
+        # The two frequencies are independent analyses; run them in
+        # separate processes and report once both finish
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(run_frequency_analysis, df, freq,
+                                seasonal_period, freq_name)
+                for freq, seasonal_period, freq_name in frequencies]
+            all_results = [future.result() for future in futures]
+
+        for freq_result in all_results:
+            freq_name = freq_result['frequency']
+            results = freq_result['results']
             if results['successful_count'] > 0:
                 print(f"\n✅ {freq_name.upper()} ANALYSIS COMPLETE!")
-                print(f"   Successfully fitted: {results['successful_count']}/{len(model_configs)} models")
+                print(f"   Successfully fitted: {results['successful_count']}/{freq_result['model_count']} models")
                 print(f"   Best {freq_name.lower()} model: {results['best_model']['label']}")
             else:
                 print(f"\n❌ {freq_name.upper()} ANALYSIS FAILED!")
                 print(f"   No {freq_name.lower()} models fitted successfully")
-        
+
         # Overall summary
         print(f"\n{'='*70}")
         print("FINAL SUMMARY - ALL 8 SARIMA MODELS")
@@ -1,6 +1,7 @@
 import pandas as pd
 import mysql.connector
-import csv
+import itertools
+import pyarrow.csv as pacsv
 
 # this is the dataframe that we want to upload to the database
 raw_path = 'data/raw/pp-2024.csv'
@@ -10,19 +11,28 @@ passowrd = ''
 host = 'localhost'
 database = 'property_data2024'
 
+# rows per INSERT statement; one multi-row VALUES packet per batch keeps
+# memory bounded and avoids one oversized packet for the whole file
+BATCH_SIZE = 10000
+# commit every K batches so the redo log is flushed a handful of times,
+# not once per row
+COMMIT_EVERY = 10
+
 
 mydb = mysql.connector.connect(
     host=host,
     user=user,
     password=passowrd,
-    database=database
+    database=database,
+    autocommit=False,
+    use_pure=False  # C-extension cursor: binary protocol, no per-row parse
 )
 
 mycursor = mydb.cursor()
 #create database if it doesn't exist
-# mycursor.execute(f"CREATE DATABASE IF NOT EXISTS {database}")  
+# mycursor.execute(f"CREATE DATABASE IF NOT EXISTS {database}")
 
-# create the table from the dataframe df 
+# create the table from the dataframe df
 #df = pd.read_csv(raw_path)
 mycursor.execute(f"CREATE TABLE IF NOT EXISTS {database}.property_data ("
     "Price INT,  "
@@ -36,32 +46,59 @@ mycursor.execute(f"CREATE TABLE IF NOT EXISTS {database}.property_data ("
 # delete all rows from the table if it exists
 #mycursor.execute(f"DELETE FROM {database}.property_data")
 
-# mycursor.execute(f"DELETE FROM {database}.property_data")
+base_sql = (f"INSERT INTO {database}.property_data "
+            "(Price, Datetime, Postcode, Property_Type, "
+            "New_built_indicator, Tenure_Type, City) VALUES ")
+# Pre-expand the VALUES clause once for the fixed batch size; only the
+# final short chunk pays for building a statement string of its own
+ROW_TEMPLATE = "(%s,%s,%s,%s,%s,%s,%s)"
+SQL_FULL = base_sql + ",".join([ROW_TEMPLATE] * BATCH_SIZE)
+
+
+def read_rows(path):
+    """Yield one tuple per CSV row, parsing in Arrow's C engine.
 
-# insert_row = list()
-# with open(raw_path, 'r') as f:
-#     reader = csv.reader(f)
-#     for row in reader:
-#         insert_row.append([ int(row[1]), row[2], row[3], row[4], row[5], row[6], row[7]])
+    pyarrow.csv.open_csv tokenizes and type-converts whole blocks at a
+    time (including the int cast on Price), so the Python level only has
+    to hand finished tuples to the INSERT batches.
+    """
+    columns = [f'c{i}' for i in range(16)]
+    wanted = ['c1', 'c2', 'c3', 'c4', 'c5', 'c6', 'c7']
+    reader = pacsv.open_csv(
+        path,
+        read_options=pacsv.ReadOptions(column_names=columns, skip_rows=1),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=wanted,
+            # quoted-empty fields ("") insert as NULL rather than ''
+            strings_can_be_null=True,
+            column_types={'c1': 'int64'}))
+    for batch in reader:
+        yield from zip(*(batch.column(name).to_pylist() for name in wanted))
 
-#     # Insert data into the table
-#     mycursor.execute(f"INSERT INTO {database}.property_data "
-#                      "(Price, Datetime, Postcode, Property_Type, "
-#                      "New_built_indicator, Tenure_Type, City) "
-#                      "VALUES (%s, %s, %s, %s, %s, %s, %s)", insert_row)
-#     mydb.commit()
-# breakpoint()
 
-insert_row = list()
-with open(raw_path, 'r') as f:
-    reader = csv.reader(f)
-    next(reader)  # Skip header row
-    for row in reader:
-        insert_row.append((int(row[1]), row[2], row[3], row[4], row[5], row[6], row[7]))
-    # Insert data into the table
-    mycursor.executemany(f"INSERT INTO {database}.property_data "
-                         "(Price, Datetime, Postcode, Property_Type, "
-                         "New_built_indicator, Tenure_Type, City) "
-                         "VALUES (%s, %s, %s, %s, %s, %s, %s)", insert_row)
+try:
+    rows = read_rows(raw_path)
+    total_rows = 0
+    batch_number = 0
+    while True:
+        chunk = list(itertools.islice(rows, BATCH_SIZE))
+        if not chunk:
+            break
+        # full batches reuse the pre-expanded statement string
+        if len(chunk) == BATCH_SIZE:
+            sql = SQL_FULL
+        else:
+            sql = base_sql + ",".join([ROW_TEMPLATE] * len(chunk))
+        flat = list(itertools.chain.from_iterable(chunk))
+        mycursor.execute(sql, flat)
+        total_rows += len(chunk)
+        batch_number += 1
+        if batch_number % COMMIT_EVERY == 0:
+            mydb.commit()
     mydb.commit()
-breakpoint()
+    print(f"Inserted {total_rows} rows in {batch_number} batches")
+finally:
+    # clean up the connection, mirroring create_db_and_table.py
+    mycursor.close()
+    if mydb.is_connected():
+        mydb.close()
@@ -1,59 +1,180 @@
 import pandas as pd
 import numpy as np
 import os
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from data_cleaning import _read_pp_csv, derive_postcode_area
 
 
 def load_multi_year_data():
     """Load and combine property data from 2022-2024"""
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(script_dir)
-    
-    all_data = []
+
     years = ['2022', '2023', '2024']
-    
-    for year in years:
-        raw_path = os.path.join(project_root, 'data', 'raw', f'pp-{year}.csv')
+    raw_paths = [os.path.join(project_root, 'data', 'raw', f'pp-{year}.csv')
+                 for year in years]
+
+    # Short-circuit on the combined Parquet cache (shared with the
+    # time_series_analysis loader) whenever it is at least as new as
+    # every raw CSV; rebuilds happen only after a raw-data refresh
+    cache_path = os.path.join(project_root, 'data', 'processed',
+                              'combined_2022_2024.parquet')
+    raw_mtimes = [os.path.getmtime(p) for p in raw_paths
+                  if os.path.exists(p)]
+    if (raw_mtimes and os.path.exists(cache_path)
+            and os.path.getmtime(cache_path) >= max(raw_mtimes)):
+        combined_df = pd.read_parquet(cache_path)
+        print(f"Loaded {len(combined_df)} properties from combined "
+              f"Parquet cache")
+        return combined_df
+
+    def load_one_year(year, raw_path):
         print(f"Loading {year} data...")
-        
-        if os.path.exists(raw_path):
-            # Load and clean data
-            df = pd.read_csv(raw_path, header=None)
-            df_clean = df[[1, 2, 3, 4, 5, 6, 11]].copy()
-            df_clean.columns = ['Price', 'Date', 'Postcode', 'Property_Type', 
-                               'New_built_indicator', 'Tenure_Type', 'City']
-            
-            # Clean date format
-            df_clean['Date'] = df_clean['Date'].str.split(' ').str[0]
-            df_clean['Date'] = pd.to_datetime(df_clean['Date'])
-            
-            # Create Postcode_Area
-            df_clean['Postcode_Area'] = np.where(
-                df_clean['Postcode'].str[1].str.isdigit(),
-                df_clean['Postcode'].str[0],
-                df_clean['Postcode'].str[:2])
-            
-            # Filter out unreasonably low prices
-            df_clean = df_clean[df_clean['Price'] >= 30000]
-            
-            all_data.append(df_clean)
-            print(f"Loaded {len(df_clean)} properties from {year}")
-        else:
+
+        if not os.path.exists(raw_path):
             print(f"Warning: {raw_path} not found")
-    
+            return None
+
+        # Shared Arrow reader: parses just the 7 kept columns on
+        # C++ threads and filters out the sub-£30k noise rows
+        # before anything reaches pandas
+        df_clean = _read_pp_csv(raw_path, min_price=30000)
+
+        # Clean date format
+        df_clean['Date'] = df_clean['Date'].str.split(' ').str[0]
+        df_clean['Date'] = pd.to_datetime(df_clean['Date'])
+
+        # Create Postcode_Area with the shared single-pass kernel
+        # (byte-level digit test, no intermediate object Series)
+        df_clean['Postcode_Area'] = derive_postcode_area(
+            df_clean['Postcode'])
+
+        print(f"Loaded {len(df_clean)} properties from {year}")
+        return df_clean
+
+    # Load the three years concurrently. Arrow's reader releases the
+    # GIL, so plain threads overlap the heavy parse work without the
+    # cost a process pool would pay to pickle each frame back
+    with ThreadPoolExecutor(max_workers=len(years)) as executor:
+        all_data = [df for df in executor.map(load_one_year, years,
+                                              raw_paths)
+                    if df is not None]
+
+
     if all_data:
         combined_df = pd.concat(all_data, ignore_index=True)
         print(f"Combined total: {len(combined_df)} properties from {len(all_data)} years (2022-2024)")
+        # Normalize to the shared cache layout: chronological order and
+        # int32 prices, so either loader can consume the other's cache
+        combined_df.sort_values('Date', inplace=True, kind='stable',
+                                ignore_index=True)
+        combined_df['Price'] = combined_df['Price'].astype('int32')
+        # Categorical keys: the area/type groupbys below reduce over
+        # integer codes instead of hashing strings row by row
+        for col in ['Postcode_Area', 'Property_Type',
+                    'New_built_indicator', 'Tenure_Type', 'City']:
+            combined_df[col] = combined_df[col].astype('category')
+
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        combined_df.to_parquet(cache_path, index=False, compression='zstd')
         return combined_df
     else:
         raise FileNotFoundError("No raw data files found")
 
 
 def _calculate_city_average_prices(df):
-    # Always group by Postcode_Area for consistent geographic analysis
-    average_prices = df.groupby('Postcode_Area')['Price'].mean()
+    # Always group by Postcode_Area for consistent geographic analysis.
+    # observed=True/sort=False keep the groupby on categorical keys from
+    # enumerating unused categories or sorting a result we only scan.
+    average_prices = df.groupby('Postcode_Area', observed=True,
+                                sort=False)['Price'].mean()
     return average_prices
 
 
+def summarize_by_area(df):
+    """
+    Compute per-area mean price and inventory count in a single pass.
+
+    The affordability, value, and inventory reports all reduce the same
+    Price column; one groupby().agg scans it once instead of three times.
+
+    Args:
+        df: DataFrame with Postcode_Area and Price columns
+
+    Returns:
+        DataFrame indexed by Postcode_Area with mean_price and n columns
+    """
+    area = df['Postcode_Area']
+    if isinstance(area.dtype, pd.CategoricalDtype):
+        # categorical fast path: reduce straight over the integer codes
+        # with np.bincount — one fused mean+count pass, no hash table and
+        # no intermediate per-group Series
+        codes = area.cat.codes.to_numpy()
+        prices = df['Price'].to_numpy(dtype='float64')
+        valid = codes >= 0
+        if not valid.all():
+            codes = codes[valid]
+            prices = prices[valid]
+        n_groups = len(area.cat.categories)
+        counts = np.bincount(codes, minlength=n_groups)
+        sums = np.bincount(codes, weights=prices, minlength=n_groups)
+        present = counts > 0
+        return pd.DataFrame(
+            {'mean_price': sums[present] / counts[present],
+             'n': counts[present]},
+            index=pd.Index(area.cat.categories[present],
+                           name='Postcode_Area'))
+    return df.groupby('Postcode_Area', observed=True, sort=False).agg(
+        mean_price=('Price', 'mean'), n=('Price', 'size'))
+
+
+def build_postcode_city_map(df):
+    """
+    Build a postcode-area -> representative-city dict in one pass.
+
+    _get_city_for_postcode rescans the whole frame per lookup; callers
+    that report several areas should build this map once and use .get().
+
+    Args:
+        df: DataFrame with Postcode_Area and City columns
+
+    Returns:
+        dict mapping each postcode area to its most common city name
+    """
+    if 'City' not in df.columns or 'Postcode_Area' not in df.columns:
+        return {}
+    # size + idxmax picks each area's most common city with pure C-level
+    # reductions; mode() would sort and handle multimodal ties we ignore
+    counts = df.groupby(['Postcode_Area', 'City'],
+                        observed=True, sort=False).size()
+    if counts.empty:
+        return {}
+    top = counts.groupby(level=0, observed=True, sort=False).idxmax()
+    return {area: pair[1] for area, pair in top.items()}
+
+
+def build_group_cache(df):
+    """
+    Group the frame by Postcode_Area once for a whole analysis run.
+
+    The affordability, value, and inventory reports all need the same
+    per-area reductions; drivers should build this cache once and pass
+    it to each report instead of letting every function re-hash the
+    Postcode_Area column from scratch.
+
+    Args:
+        df: DataFrame with Postcode_Area, Price, and City columns
+
+    Returns:
+        SimpleNamespace with summary (per-area mean_price/n DataFrame)
+        and city_map (postcode area -> representative city dict)
+    """
+    return SimpleNamespace(summary=summarize_by_area(df),
+                           city_map=build_postcode_city_map(df))
+
+
 def _get_city_for_postcode(df, postcode_area):
     """Get a representative city name for a given postcode area"""
     if 'City' in df.columns and 'Postcode_Area' in df.columns:
@@ -64,13 +185,45 @@ def _get_city_for_postcode(df, postcode_area):
     return None
 
 
-def most_affordable_cities(df):
-    cheapest_area_avg = _calculate_city_average_prices(df)
-    cheapest_postcode = cheapest_area_avg.idxmin()
-    cheapest_price = cheapest_area_avg[cheapest_postcode]
+PriceExtremes = namedtuple('PriceExtremes',
+                           ['cheapest_area', 'cheapest_price',
+                            'highest_area', 'highest_price'])
+
+
+def price_extremes(df, cache=None):
+    """
+    Return both price extremes from a single scan of the area means.
+
+    most_affordable_cities and highest_value_cities pick opposite ends
+    of the same Series; computing them together means one groupby and
+    one pass over the means instead of two of each.
+
+    Args:
+        df: DataFrame with Postcode_Area and Price columns
+        cache: Optional group cache from build_group_cache
+
+    Returns:
+        PriceExtremes named tuple with cheapest/highest area and price
+    """
+    if cache is None:
+        cache = build_group_cache(df)
+    means = cache.summary['mean_price']
+    vals = means.to_numpy()
+    lo = vals.argmin()
+    hi = vals.argmax()
+    return PriceExtremes(means.index[lo], vals[lo],
+                         means.index[hi], vals[hi])
+
+
+def most_affordable_cities(df, cache=None):
+    if cache is None:
+        cache = build_group_cache(df)
+    extremes = price_extremes(df, cache=cache)
+    cheapest_postcode = extremes.cheapest_area
+    cheapest_price = extremes.cheapest_price
 
     # Get city name for display
-    city_name = _get_city_for_postcode(df, cheapest_postcode)
+    city_name = cache.city_map.get(cheapest_postcode)
     if city_name:
         print(f" Most affordable area: {city_name} "
               f"({cheapest_postcode}) £{cheapest_price:,.0f}")
@@ -80,13 +233,15 @@ def most_affordable_cities(df):
     return
 
 
-def highest_value_cities(df):
-    highest_area_avg = _calculate_city_average_prices(df)
-    highest_postcode = highest_area_avg.idxmax()
-    highest_price = highest_area_avg[highest_postcode]
+def highest_value_cities(df, cache=None):
+    if cache is None:
+        cache = build_group_cache(df)
+    extremes = price_extremes(df, cache=cache)
+    highest_postcode = extremes.highest_area
+    highest_price = extremes.highest_price
 
     # Get city name for display
-    city_name = _get_city_for_postcode(df, highest_postcode)
+    city_name = cache.city_map.get(highest_postcode)
     if city_name:
         print(f" Highest value area: {city_name} "
               f"({highest_postcode}) £{highest_price:,.0f}")
@@ -96,21 +251,29 @@ def highest_value_cities(df):
     return
 
 
-def city_inventory_analysis(df):
+def city_inventory_analysis(df, cache=None):
     # Always group by Postcode_Area for consistent analysis
-    inventory_counts = df.groupby('Postcode_Area').size()
+    if cache is None:
+        cache = build_group_cache(df)
+    inventory_counts = cache.summary['n']
     location_type = "Area"
 
-    most_inventory_postcode = inventory_counts.idxmax()
-    most_inventory_count = inventory_counts.max()
+    # One pass builds every city name this report prints
+    city_map = cache.city_map
+
+    counts = inventory_counts.to_numpy()
+    most_inventory_postcode = inventory_counts.index[counts.argmax()]
+    most_inventory_count = counts.max()
 
-    # Find all postcode areas with minimum count
-    least_inventory_count = inventory_counts.min()
-    least_inventory_postcodes = inventory_counts[
-        inventory_counts == least_inventory_count].index.tolist()
+    # Find all postcode areas with minimum count; flatnonzero on the raw
+    # array returns just the tie positions instead of materializing a
+    # boolean Series and filtering through the index machinery
+    least_inventory_count = counts.min()
+    tie_idx = np.flatnonzero(counts == least_inventory_count)
+    least_inventory_postcodes = inventory_counts.index.take(tie_idx).tolist()
 
     # Format display for most choices
-    city_name = _get_city_for_postcode(df, most_inventory_postcode)
+    city_name = city_map.get(most_inventory_postcode)
     if city_name:
         print(f"{location_type} with most choices: {city_name} "
               f"({most_inventory_postcode}) ({most_inventory_count} "
@@ -121,7 +284,7 @@ def city_inventory_analysis(df):
 
     # Format display for least choices
     if len(least_inventory_postcodes) == 1:
-        city_name = _get_city_for_postcode(df, least_inventory_postcodes[0])
+        city_name = city_map.get(least_inventory_postcodes[0])
         if city_name:
             print(f"{location_type} with least choices: {city_name} "
                   f"({least_inventory_postcodes[0]}) "
@@ -134,7 +297,7 @@ def city_inventory_analysis(df):
         # Show first few with city names
         formatted_areas = []
         for postcode in least_inventory_postcodes[:3]:  # Show first 3
-            city_name = _get_city_for_postcode(df, postcode)
+            city_name = city_map.get(postcode)
             if city_name:
                 formatted_areas.append(f"{city_name} ({postcode})")
             else:
@@ -150,9 +313,13 @@ def city_inventory_analysis(df):
 
 
 def price_comparison_by_new_built_status(df):
-    new_built_avg_prices = df[df['New_built_indicator'] == 'Y']['Price'].mean()
-    existing_built_avg_prices = df[
-        df['New_built_indicator'] == 'N']['Price'].mean()
+    # one grouped scan of Price computes both means instead of two
+    # full-column masked passes
+    means = df.groupby('New_built_indicator', observed=True)['Price'].mean()
+    # default to NaN so a subset missing one category prints £nan like
+    # the old masked means did, instead of formatting None
+    new_built_avg_prices = means.get('Y', float('nan'))
+    existing_built_avg_prices = means.get('N', float('nan'))
     print(f"Average price of new builds: £{new_built_avg_prices:,.0f}")
     print(f"Average price of existing properties: "
           f"£{existing_built_avg_prices:,.0f}")
@@ -160,8 +327,11 @@ def price_comparison_by_new_built_status(df):
 
 
 def price_comparison_by_tenure_type(df):
-    freehold_avg_prices = df[df['Tenure_Type'] == 'F']['Price'].mean()
-    leasehold_avg_prices = df[df['Tenure_Type'] == 'L']['Price'].mean()
+    # single grouped scan, same fusion as the new-built comparison
+    means = df.groupby('Tenure_Type', observed=True)['Price'].mean()
+    # NaN default for the same reason as the new-built comparison
+    freehold_avg_prices = means.get('F', float('nan'))
+    leasehold_avg_prices = means.get('L', float('nan'))
     print(f"Average price of freehold properties: "
           f"£{freehold_avg_prices:,.0f}")
     print(f"Average price of leasehold properties: "
@@ -1,5 +1,11 @@
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+# Memoized load_data results, keyed by (dataset, source mtime) so edits
+# to the underlying file invalidate the entry. Lets drivers that call
+# load_data several times in one process parse the file once.
+_load_cache = {}
 
 
 def clean_price_data(df):
@@ -63,17 +69,105 @@ def load_data(dataset='auto'):
         raise ValueError("Dataset must be 'synthetic', 'real', 'sample', "
                          "or 'auto'")
 
-    if not os.path.exists(csv_path):
-        raise FileNotFoundError(f"Dataset file not found: {csv_path}")
+    # Prefer a Parquet cache of the CSV: columnar, typed, and ~10x
+    # faster to load than re-parsing strings on every run
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    csv_mtime = os.path.getmtime(csv_path) if os.path.exists(csv_path) else 0
+
+    cache_key = (dataset, csv_mtime)
+    if cache_key in _load_cache:
+        return _load_cache[cache_key]
 
-    df = pd.read_csv(csv_path)
-    print(f"Loaded {len(df)} {data_type} properties from CSV")
+    if (os.path.exists(parquet_path)
+            and os.path.getmtime(parquet_path) >= csv_mtime):
+        df = pd.read_parquet(parquet_path)
+        print(f"Loaded {len(df)} {data_type} properties from Parquet cache")
+    else:
+        if not os.path.exists(csv_path):
+            raise FileNotFoundError(f"Dataset file not found: {csv_path}")
+        df = pd.read_csv(csv_path)
+        df.to_parquet(parquet_path, index=False)
+        print(f"Loaded {len(df)} {data_type} properties from CSV")
+
+    # Shrink the hot columns: UK prices fit comfortably in int32, and the
+    # code/name columns are low-cardinality. Half (or far less) the bytes
+    # per row means half the memory traffic in every downstream groupby.
+    if 'Price' in df.columns:
+        df['Price'] = df['Price'].astype('int32')
+    for col in ['Postcode_Area', 'City', 'Property_Type', 'Property Type',
+                'New_built_indicator', 'New built indicator',
+                'Tenure_Type', 'Tenure Type']:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
 
     # Clean price data for real datasets only
     if dataset in ['real', 'sample'] and 'synthetic' not in data_type:
         df = clean_price_data(df)
         print(f"After cleaning: {len(df)} properties remain")
 
+    _load_cache[cache_key] = df
+    return df
+
+
+def derive_postcode_area(postcode):
+    """
+    Derive the postcode area (leading letters) for a Series of postcodes.
+
+    Views the postcodes as fixed-width bytes and tests the second byte
+    against the ASCII digit range, so the whole column is reduced with
+    contiguous NumPy byte comparisons instead of three chained .str
+    passes that each allocate a new object Series.
+
+    Args:
+        postcode: Series of postcode strings
+
+    Returns:
+        Series of one- or two-letter area codes (NaN where postcode is)
+    """
+    raw = np.asarray(postcode.fillna('').astype(str), dtype='S4')
+    width = raw.dtype.itemsize
+    second = raw.view('u1').reshape(len(raw), width)[:, 1]
+    second_is_digit = (second >= ord('0')) & (second <= ord('9'))
+    area = np.where(second_is_digit,
+                    raw.astype('S1'), raw.astype('S2')).astype('U2')
+    return pd.Series(area, index=postcode.index).mask(postcode.isna())
+
+
+def _read_pp_csv(raw_path, min_price=None):
+    """
+    Read a raw Price Paid CSV, decoding only the 7 columns we keep.
+
+    The raw file has 16 headerless columns; pyarrow.csv tokenizes and
+    type-converts in parallel C++ and skips the unused 9 entirely,
+    instead of pandas parsing everything and then dropping most of it.
+
+    Args:
+        raw_path: Path to a raw pp-YYYY.csv file
+        min_price: If given, drop rows below this price while still in
+                   Arrow, before any Python objects are allocated
+
+    Returns:
+        DataFrame with the standard 7 cleaned-data columns
+    """
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+    columns = [f'c{i}' for i in range(16)]
+    wanted = ['c1', 'c2', 'c3', 'c4', 'c5', 'c6', 'c11']
+    tbl = pacsv.read_csv(
+        raw_path,
+        read_options=pacsv.ReadOptions(column_names=columns),
+        convert_options=pacsv.ConvertOptions(
+            include_columns=wanted,
+            # quoted-empty fields ("") become null, matching what
+            # pandas read as NaN — the dataset has blank postcodes
+            strings_can_be_null=True,
+            # keep c2 as text; the callers slice/parse the date prefix
+            column_types={'c1': 'int64', 'c2': 'string'}))
+    if min_price is not None:
+        tbl = tbl.filter(pc.field('c1') >= min_price)
+    df = tbl.to_pandas()
+    df.columns = ['Price', 'Date', 'Postcode', 'Property_Type',
+                  'New_built_indicator', 'Tenure_Type', 'City']
     return df
 
 
@@ -85,19 +179,14 @@ def clean_pp_data():
     raw_path = os.path.join(project_root, 'data', 'raw', 'pp-2024.csv')
 
     print("Loading raw property data (this may take a moment...)")
-    df_pp = pd.read_csv(raw_path, header=None)
-    print(f"Loaded {len(df_pp)} raw property records")
+    df_clean = _read_pp_csv(raw_path)
+    print(f"Loaded {len(df_clean)} raw property records")
 
-    df_clean = df_pp[[1, 2, 3, 4, 5, 6, 11]].copy()
-    df_clean.columns = ['Price', 'Date', 'Postcode', 'Property_Type',
-                        'New_built_indicator', 'Tenure_Type', 'City']
+    # slice the fixed-width date prefix instead of splitting: no per-row
+    # list allocation for "YYYY-MM-DD HH:MM" timestamps
+    df_clean['Date'] = df_clean['Date'].str.slice(0, 10)
 
-    df_clean['Date'] = df_clean['Date'].str.split(' ').str[0]
-
-    df_clean['Postcode_Area'] = np.where(
-        df_clean['Postcode'].str[1].str.isdigit(),
-        df_clean['Postcode'].str[0],
-        df_clean['Postcode'].str[:2])
+    df_clean['Postcode_Area'] = derive_postcode_area(df_clean['Postcode'])
 
     # Save full dataset
     processed_path = os.path.join(project_root, 'data', 'processed',
@@ -106,8 +195,12 @@ def clean_pp_data():
     print(f"Saved {len(df_clean)} cleaned properties to "
           f"property_data_real.csv")
 
-    # Create sample for demo/testing (5000 records)
-    sample_df = df_clean.sample(n=min(5000, len(df_clean)), random_state=42)
+    # Create sample for demo/testing (5000 records). rng.choice draws
+    # just k row positions instead of .sample permuting the whole index
+    rng = np.random.default_rng(42)
+    idx = rng.choice(len(df_clean), size=min(5000, len(df_clean)),
+                     replace=False)
+    sample_df = df_clean.take(idx)
     sample_path = os.path.join(project_root, 'data', 'samples',
                                'property_data_real_sample.csv')
     sample_df.to_csv(sample_path, index=False)
@@ -122,50 +215,65 @@ def clean_multi_year_data():
     script_dir = os.path.dirname(os.path.abspath(__file__))
     project_root = os.path.dirname(script_dir)
     
-    all_data = []
     years = ['2022', '2023', '2024']
-    
-    for year in years:
+
+    def load_one_year(year):
         raw_path = os.path.join(project_root, 'data', 'raw', f'pp-{year}.csv')
         print(f"Loading {year} data...")
-        
-        if os.path.exists(raw_path):
-            # Load and clean data
-            df = pd.read_csv(raw_path, header=None)
-            df_clean = df[[1, 2, 3, 4, 5, 6, 11]].copy()
-            df_clean.columns = ['Price', 'Date', 'Postcode', 'Property_Type', 
-                               'New_built_indicator', 'Tenure_Type', 'City']
-            
-            # Clean date format
-            df_clean['Date'] = df_clean['Date'].str.split(' ').str[0]
-            df_clean['Date'] = pd.to_datetime(df_clean['Date'])
-            
-            # Create Postcode_Area
-            df_clean['Postcode_Area'] = np.where(
-                df_clean['Postcode'].str[1].str.isdigit(),
-                df_clean['Postcode'].str[0],
-                df_clean['Postcode'].str[:2])
-            
-            # Filter out unreasonably low prices
-            df_clean = df_clean[df_clean['Price'] >= 30000]
-            
-            all_data.append(df_clean)
-            print(f"Loaded {len(df_clean)} properties from {year}")
-        else:
+
+        if not os.path.exists(raw_path):
             print(f"Warning: {raw_path} not found")
-    
+            return None
+
+        # Load and clean data; the sub-£30k noise rows are dropped
+        # inside Arrow so they never become pandas objects
+        df_clean = _read_pp_csv(raw_path, min_price=30000)
+
+        # Clean date format: slice the fixed-width prefix (no per-row
+        # list allocation) and parse with an explicit format so
+        # to_datetime skips inference; cache=True dedups repeat dates
+        df_clean['Date'] = df_clean['Date'].str.slice(0, 10)
+        df_clean['Date'] = pd.to_datetime(df_clean['Date'],
+                                          format='%Y-%m-%d', cache=True)
+
+        # Create Postcode_Area
+        df_clean['Postcode_Area'] = derive_postcode_area(
+            df_clean['Postcode'])
+
+        print(f"Loaded {len(df_clean)} properties from {year}")
+        return df_clean
+
+    # pyarrow's CSV reader releases the GIL, so three threads parse the
+    # three yearly files concurrently on C++ workers
+    with ThreadPoolExecutor(max_workers=len(years)) as executor:
+        all_data = [df for df in executor.map(load_one_year, years)
+                    if df is not None]
+
     if all_data:
         combined_df = pd.concat(all_data, ignore_index=True)
         print(f"Combined total: {len(combined_df)} properties from {len(all_data)} years (2022-2024)")
-        
-        # Save multi-year dataset
-        processed_path = os.path.join(project_root, 'data', 'processed', 'property_data_multi_year.csv')
+
+        # Shrink Price to int32 (UK prices fit easily) and dictionary-
+        # encode the low-cardinality key columns so downstream groupbys
+        # move half the bytes and hash small integer codes instead of
+        # Python strings (pair with observed=True at the call sites)
+        combined_df['Price'] = combined_df['Price'].astype('int32')
+        for col in ['Postcode_Area', 'Property_Type', 'New_built_indicator',
+                    'Tenure_Type', 'City']:
+            combined_df[col] = combined_df[col].astype('category')
+
+        # Save multi-year dataset as Parquet: columnar, typed, and far
+        # smaller/faster than re-parsing a 3M-row CSV on every analysis run
+        processed_path = os.path.join(project_root, 'data', 'processed', 'property_data_multi_year.parquet')
         os.makedirs(os.path.dirname(processed_path), exist_ok=True)
-        combined_df.to_csv(processed_path, index=False)
-        print(f"Saved {len(combined_df)} multi-year properties to property_data_multi_year.csv")
+        combined_df.to_parquet(processed_path, index=False, compression='zstd')
+        print(f"Saved {len(combined_df)} multi-year properties to property_data_multi_year.parquet")
         
         # Create sample for demo/testing (10000 records from multi-year data)
-        sample_df = combined_df.sample(n=min(10000, len(combined_df)), random_state=42)
+        # rng.choice draws just k row positions instead of permuting 3M rows
+        rng = np.random.default_rng(42)
+        idx = rng.choice(len(combined_df), size=min(10000, len(combined_df)), replace=False)
+        sample_df = combined_df.take(idx)
         sample_path = os.path.join(project_root, 'data', 'samples', 'property_data_multi_year_sample.csv')
         os.makedirs(os.path.dirname(sample_path), exist_ok=True)
         sample_df.to_csv(sample_path, index=False)
@@ -1,4 +1,5 @@
 import pandas as pd
+import numpy as np
 
 
 # London postcode areas (comprehensive list)
@@ -10,49 +11,88 @@ LONDON_POSTCODES = {
 }
 
 
-def filter_london_properties(df):
+def _postcode_mask(area, wanted):
+    """
+    Boolean row mask for membership of a postcode-area column in wanted.
+
+    For categorical columns this tests each category once, then gathers
+    the per-category answers with the integer codes — a single
+    vectorized table lookup with no per-row hashing. The trailing False
+    entry absorbs the -1 codes that mark missing values. Falls back to
+    plain isin for non-categorical input.
+
+    Args:
+        area: Postcode_Area Series
+        wanted: Set of postcode areas to keep
+
+    Returns:
+        ndarray bool mask aligned with area
+    """
+    if isinstance(area.dtype, pd.CategoricalDtype):
+        lut = np.append(area.cat.categories.isin(list(wanted)), False)
+        return lut[area.cat.codes.to_numpy()]
+    return area.isin(wanted).to_numpy()
+
+
+def filter_london_properties(df, copy=True):
     """
     Filter dataframe to include only London properties based on postcode areas.
     
     Args:
         df: DataFrame with property data including 'Postcode_Area' column
+        copy: Pass False when the result is read-only to skip the
+              defensive copy (halves allocation at the filter boundary)
         
     Returns:
         DataFrame: Filtered dataframe with only London properties
     """
-    london_df = df[df['Postcode_Area'].isin(LONDON_POSTCODES)].copy()
+    # Frames this function already filtered carry a marker in attrs, so
+    # callers can freely pass a pre-filtered frame through code paths
+    # that filter defensively without paying the row scan again
+    if df.attrs.get('london_only'):
+        return df
+    london_df = df[_postcode_mask(df['Postcode_Area'], LONDON_POSTCODES)]
+    if copy:
+        london_df = london_df.copy()
+    london_df.attrs['london_only'] = True
     print(f"Filtered to {len(london_df)} London properties from {len(df)} total properties")
     return london_df
 
 
-def filter_by_postcode_areas(df, postcode_areas):
+def filter_by_postcode_areas(df, postcode_areas, copy=True):
     """
     Filter dataframe by specific postcode areas.
     
     Args:
         df: DataFrame with property data
         postcode_areas: List or set of postcode areas to include
+        copy: Pass False for read-only consumers to skip the copy
         
     Returns:
         DataFrame: Filtered dataframe
     """
-    filtered_df = df[df['Postcode_Area'].isin(postcode_areas)].copy()
+    filtered_df = df[_postcode_mask(df['Postcode_Area'], postcode_areas)]
+    if copy:
+        filtered_df = filtered_df.copy()
     print(f"Filtered to {len(filtered_df)} properties in areas: {', '.join(postcode_areas)}")
     return filtered_df
 
 
-def filter_central_london_properties(df):
+def filter_central_london_properties(df, copy=True):
     """
     Filter to Central London postcodes only (EC, WC, E, N, NW, SE, SW, W).
     
     Args:
         df: DataFrame with property data
+        copy: Pass False for read-only consumers to skip the copy
         
     Returns:
         DataFrame: Filtered dataframe with only Central London properties
     """
     central_london_postcodes = {'EC', 'WC', 'E', 'N', 'NW', 'SE', 'SW', 'W'}
-    central_df = df[df['Postcode_Area'].isin(central_london_postcodes)].copy()
+    central_df = df[_postcode_mask(df['Postcode_Area'], central_london_postcodes)]
+    if copy:
+        central_df = central_df.copy()
     print(f"Filtered to {len(central_df)} Central London properties")
     return central_df
 
@@ -67,14 +107,43 @@ def get_london_property_stats(df):
     Returns:
         dict: Dictionary with various statistics
     """
+    # Fused reductions: one pass over Price for the four headline stats
+    # and one grouped pass for the per-type count and mean, instead of
+    # six separate traversals of the frame
+    price_stats = df['Price'].agg(['mean', 'median', 'min', 'max'])
+
+    ptype = df['Property_Type']
+    if isinstance(ptype.dtype, pd.CategoricalDtype):
+        # with only a handful of types, bincount over the category
+        # codes beats even the grouped agg: two C loops, no dispatcher
+        codes = ptype.cat.codes.to_numpy()
+        prices = df['Price'].to_numpy(dtype='float64')
+        valid = codes >= 0
+        if not valid.all():
+            codes = codes[valid]
+            prices = prices[valid]
+        n_types = len(ptype.cat.categories)
+        type_counts = np.bincount(codes, minlength=n_types)
+        type_sums = np.bincount(codes, weights=prices, minlength=n_types)
+        present = type_counts > 0
+        cats = ptype.cat.categories[present]
+        property_type_counts = dict(zip(cats, type_counts[present]))
+        avg_price_by_type = dict(
+            zip(cats, type_sums[present] / type_counts[present]))
+    else:
+        by_type = df.groupby('Property_Type',
+                             observed=True)['Price'].agg(['mean', 'count'])
+        property_type_counts = by_type['count'].to_dict()
+        avg_price_by_type = by_type['mean'].to_dict()
+
     stats = {
         'total_properties': len(df),
-        'avg_price': df['Price'].mean(),
-        'median_price': df['Price'].median(),
-        'min_price': df['Price'].min(),
-        'max_price': df['Price'].max(),
-        'property_type_counts': df['Property_Type'].value_counts().to_dict(),
+        'avg_price': price_stats['mean'],
+        'median_price': price_stats['median'],
+        'min_price': price_stats['min'],
+        'max_price': price_stats['max'],
+        'property_type_counts': property_type_counts,
         'postcode_areas': df['Postcode_Area'].nunique(),
-        'avg_price_by_type': df.groupby('Property_Type')['Price'].mean().to_dict()
+        'avg_price_by_type': avg_price_by_type
     }
     return stats
\ No newline at end of file